@@ -4,22 +4,36 @@ Terminal Script Writer - A minimal TUI for structured screenwriting
 Based on David Lynch's 70-card method.
 """
 
+import asyncio
+import hashlib
 import json
+import locale
 import os
-import shutil
+import re
 import subprocess
 import platform
-import tempfile
+import time
+from collections import deque
+from contextlib import ExitStack
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
+from functools import lru_cache
+from itertools import repeat
+from typing import Awaitable, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from textual.app import App, ComposeResult
 from textual.containers import Horizontal, Vertical, Container
-from textual.widgets import Static, ListView, ListItem, Input, Header, Footer, TextArea, ProgressBar, Button
+from textual.widgets import Static, ListView, ListItem, Input, Header, Footer, TextArea, ProgressBar, Button, RichLog
 from textual.screen import Screen
-from textual import events
+from textual import events, work
 from textual.binding import Binding
+from textual.timer import Timer
+
+try:
+    import pyperclip  # Optional: in-process clipboard access, no subprocess per copy/paste
+except ImportError:
+    pyperclip = None
 
 
 # Configuration
@@ -27,6 +41,117 @@ CONFIG_DIR = Path.home() / ".scriptwriter"
 CONFIG_FILE = CONFIG_DIR / "projects.json"
 DEFAULT_SCRIPTS_DIR = Path.home() / "Documents" / "Scripts"
 
+_NON_SPACE_RE = re.compile(rb'\S')
+# Card files may use \n, \r\n or lone \r line endings, as text-mode reads accept
+_LINE_END_RE = re.compile(rb'[\r\n]')
+# Raw fd reads for card parsing: no buffered-file setup, no Windows newline translation
+_READ_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+# Thread count for overlapping per-card reads
+_IO_WORKERS = min(16, (os.cpu_count() or 1) * 4)
+
+
+def _decode_card(data: bytes) -> str:
+    """Decode card file bytes the way a text-mode read would, preferring UTF-8."""
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        # Older versions saved cards in the locale encoding; the next save rewrites them as UTF-8
+        text = data.decode(locale.getpreferredencoding(False))
+    return text.replace('\r\n', '\n').replace('\r', '\n')
+
+
+def _card_title(text: str) -> str:
+    """Title from a card's "# Title" first line; empty if the card has no header."""
+    first_line = text.partition('\n')[0].strip()
+    return first_line[1:].strip() if first_line.startswith('#') else ""
+
+
+def _atomic_write(path: Path, data: bytes):
+    """Write data to path via a temp file and os.replace, so readers never see a partial file."""
+    # Replace a symlink's target, not the link itself
+    path = Path(os.path.realpath(path))
+    tmp = path.with_name(f".{path.name}.{os.urandom(4).hex()}.tmp")
+    # Created like a plain open() would be, so the umask decides the permissions
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        with open(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            # Keep the permissions of the file being replaced
+            os.chmod(tmp, os.stat(path).st_mode & 0o7777)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+async def _run_clipboard_command(command: List[str], text: Optional[str] = None) -> str:
+    """Run a clipboard helper without blocking the event loop."""
+    encoding = locale.getpreferredencoding(False)
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        stdin=asyncio.subprocess.PIPE if text is not None else asyncio.subprocess.DEVNULL,
+        # Copy helpers like xclip fork and keep the selection alive; a stdout
+        # pipe would be held open by that child and never reach EOF
+        stdout=asyncio.subprocess.PIPE if text is None else asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    stdout, _ = await process.communicate(text.encode(encoding) if text is not None else None)
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, command)
+    if stdout is None:
+        return ""
+    return stdout.decode(encoding).replace('\r\n', '\n').replace('\r', '\n')
+
+
+def _detect_clipboard_backend() -> Tuple[Callable[[str], Awaitable[None]], Callable[[], Awaitable[str]]]:
+    """Pick the (copy, paste) coroutines for this platform."""
+    system = platform.system()
+    if system == "Darwin":  # macOS
+        copy_command, paste_command = ["pbcopy"], ["pbpaste"]
+    elif system == "Linux":
+        copy_command = ["xclip", "-selection", "clipboard"]
+        paste_command = ["xclip", "-selection", "clipboard", "-o"]
+    elif system == "Windows":
+        copy_command, paste_command = ["clip"], ["powershell", "-command", "Get-Clipboard"]
+    else:
+        copy_command = paste_command = None
+    
+    async def command_copy(text: str):
+        if copy_command:
+            await _run_clipboard_command(copy_command, text)
+    
+    async def command_paste() -> str:
+        return await _run_clipboard_command(paste_command) if paste_command else ""
+    
+    if pyperclip is None:
+        return command_copy, command_paste
+    
+    async def pyperclip_copy(text: str):
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, pyperclip.copy, text)
+        except pyperclip.PyperclipException:
+            await command_copy(text)  # No backend available; fall back to platform commands
+    
+    async def pyperclip_paste() -> str:
+        try:
+            return await asyncio.get_running_loop().run_in_executor(None, pyperclip.paste)
+        except pyperclip.PyperclipException:
+            return await command_paste()  # No backend available; fall back to platform commands
+    
+    return pyperclip_copy, pyperclip_paste
+
+
+# Resolved once: the platform doesn't change while the app runs
+_CLIP_BACKEND = _detect_clipboard_backend()
+
 
 class Project:
     """Manages project data and file operations."""
@@ -37,6 +162,29 @@ class Project:
         self.cards_dir = self.path / "cards"
         self.exports_dir = self.path / "exports"
         self.order_file = self.path / ".cardorder"
+        # Card files are always 01.md-70.md; index 0 is unused
+        self._card_names = tuple(f"{i:02d}.md" for i in range(71))
+        self._card_paths = tuple(self.cards_dir / name for name in self._card_names)
+        self._card_numbers = {name: i for i, name in enumerate(self._card_names) if i}
+        # (mtime_ns, order) of the last card order read or written
+        self._order_cache: Optional[Tuple[int, List[int]]] = None
+        # card_num -> (mtime_ns, title, is_written)
+        self._meta_cache: Dict[int, Tuple[int, str, bool]] = {}
+        # card_num -> (mtime_ns, title, content) of the last full read
+        self._card_cache: Dict[int, Tuple[int, str, str]] = {}
+        self.titles_loaded = False
+    
+    def invalidate(self):
+        """Drop all cached card data so the next access re-reads from disk."""
+        self._order_cache = None
+        self._meta_cache.clear()
+        self._card_cache.clear()
+        self.titles_loaded = False
+    
+    def _forget_card(self, card_num: int):
+        """Drop cached data for a card after writing it."""
+        self._meta_cache.pop(card_num, None)
+        self._card_cache.pop(card_num, None)
     
     def create(self):
         """Create new project structure."""
@@ -50,65 +198,204 @@ class Project:
         
         # Create empty card files
         for i in range(1, 71):
-            card_file = self.cards_dir / f"{i:02d}.md"
+            card_file = self._card_paths[i]
             if not card_file.exists():
-                card_file.write_text("")
+                card_file.write_text("", encoding="utf-8")
+    
+    def card_path(self, card_num: int) -> Path:
+        """Get the markdown file for a card."""
+        if 0 < card_num < len(self._card_paths):
+            return self._card_paths[card_num]
+        return self.cards_dir / f"{card_num:02d}.md"
     
     def load_card_order(self) -> List[int]:
         """Load current card order."""
-        if self.order_file.exists():
-            try:
-                order_text = self.order_file.read_text().strip()
-                return [int(x) for x in order_text.split(',')]
-            except (ValueError, FileNotFoundError):
-                pass
-        return list(range(1, 71))
+        try:
+            mtime_ns = self.order_file.stat().st_mtime_ns
+            if self._order_cache and self._order_cache[0] == mtime_ns:
+                return list(self._order_cache[1])
+            order = list(map(int, self.order_file.read_bytes().split(b',')))
+        except (ValueError, FileNotFoundError):
+            return list(range(1, 71))
+        self._order_cache = (mtime_ns, order)
+        return list(order)
     
     def save_card_order(self, order: List[int]):
         """Save card order to file."""
-        self.order_file.write_text(','.join(map(str, order)))
+        self.order_file.write_text(','.join(map(str, order)), encoding="utf-8")
+        self._order_cache = (self.order_file.stat().st_mtime_ns, list(order))
+    
+    @staticmethod
+    def _card_is_written(data: bytes, eof: bool) -> Optional[bool]:
+        """Decide from a file prefix whether a card is written, or None if more data is needed."""
+        # Consider written if more than just the header
+        body = data.lstrip()
+        if body and not body.startswith(b'#'):
+            return True
+        header_end = _LINE_END_RE.search(body)
+        if header_end and _NON_SPACE_RE.search(body, header_end.end()):
+            return True
+        return False if eof else None
+    
+    @staticmethod
+    def _parse_card(path) -> Tuple[str, bool]:
+        """Read a card file and return its (title, is_written), stopping once both are known."""
+        try:
+            fd = os.open(path, _READ_FLAGS)
+        except FileNotFoundError:
+            return "", False
+        try:
+            data = b""
+            while True:
+                chunk = os.read(fd, 8192)
+                data += chunk
+                is_written = Project._card_is_written(data, eof=not chunk)
+                # The title also needs the whole first line
+                if is_written is not None and (not chunk or _LINE_END_RE.search(data)):
+                    break
+        finally:
+            os.close(fd)
+        
+        # Same rule as read_card, so the list and the editor agree on the title
+        title = _card_title(_decode_card(_LINE_END_RE.split(data, 1)[0]))
+        return title, is_written
     
     def get_card_title_from_file(self, card_num: int) -> str:
         """Get title from markdown file first line."""
-        card_file = self.cards_dir / f"{card_num:02d}.md"
-        if card_file.exists():
-            try:
-                content = card_file.read_text()
-                if content.strip():
-                    first_line = content.split('\n')[0].strip()
-                    if first_line.startswith('#'):
-                        return first_line[1:].strip()  # Remove # and whitespace
-            except:
-                pass
-        return ""  # Empty title if no file or no header
+        return self._parse_card(self.card_path(card_num))[0]
+    
+    def _scan_cards_dir(self) -> Dict[int, os.DirEntry]:
+        """Map card numbers to directory entries with a single scandir pass."""
+        try:
+            with os.scandir(self.cards_dir) as it:
+                return {
+                    self._card_numbers[entry.name]: entry
+                    for entry in it
+                    if entry.name in self._card_numbers and entry.is_file()
+                }
+        except FileNotFoundError:
+            return {}
+    
+    def _cached_meta(self, card_num: int, entry: Optional[os.DirEntry] = None) -> Tuple[Optional[Tuple[str, bool]], Optional[Tuple[str, int]]]:
+        """Return (meta, None) if the cache or a missing file answers, else (None, (path, mtime_ns)) to read."""
+        path = entry.path if entry is not None else self.card_path(card_num)
+        try:
+            mtime_ns = (entry.stat() if entry is not None else os.stat(path)).st_mtime_ns
+        except FileNotFoundError:
+            self._meta_cache.pop(card_num, None)
+            return ("", False), None
+        
+        cached = self._meta_cache.get(card_num)
+        if cached and cached[0] == mtime_ns:
+            return (cached[1], cached[2]), None
+        return None, (path, mtime_ns)
+    
+    def _read_meta(self, card_num: int, path, mtime_ns: int) -> Tuple[str, bool]:
+        """Parse a card and cache its meta under the mtime it was read at."""
+        title, is_written = self._parse_card(path)
+        self._meta_cache[card_num] = (mtime_ns, title, is_written)
+        return title, is_written
+    
+    def get_card_meta(self, card_num: int) -> Tuple[str, bool]:
+        """Get (title, is_written) for a card, re-reading only if the file changed."""
+        meta, stale = self._cached_meta(card_num)
+        return meta if stale is None else self._read_meta(card_num, *stale)
+    
+    def load_card_meta(self, progress_callback=None) -> Dict[int, Tuple[str, bool]]:
+        """Load (title, is_written) for all cards."""
+        entries = self._scan_cards_dir()
+        meta = {}
+        stale = {}  # card_num -> (path, mtime_ns) for cards that need reading
+        
+        def loaded(card_num: int, card_meta: Tuple[str, bool]):
+            meta[card_num] = card_meta
+            if progress_callback:
+                progress_callback(len(meta), 70)
+        
+        for i in range(1, 71):
+            card_meta, stale_key = self._cached_meta(i, entries.get(i))
+            if stale_key is None:
+                loaded(i, card_meta)
+            else:
+                stale[i] = stale_key
+        
+        if len(stale) > 8:
+            # Reads are independent and I/O-bound, so overlap them
+            with ThreadPoolExecutor(max_workers=_IO_WORKERS) as executor:
+                futures = {executor.submit(self._read_meta, i, *key): i for i, key in stale.items()}
+                for future in as_completed(futures):
+                    loaded(futures[future], future.result())
+        else:
+            for i, key in stale.items():
+                loaded(i, self._read_meta(i, *key))
+        
+        self.titles_loaded = True
+        return dict(sorted(meta.items()))
     
     def load_card_titles(self, progress_callback=None) -> Dict[str, str]:
         """Load titles from all markdown files."""
-        titles = {}
-        for i in range(1, 71):
-            titles[str(i)] = self.get_card_title_from_file(i)
-            if progress_callback:
-                progress_callback(i, 70)
-        return titles
+        meta = self.load_card_meta(progress_callback)
+        return {str(i): title for i, (title, _) in meta.items()}
     
     def get_card_content(self, card_num: int) -> str:
         """Get content of a specific card."""
-        card_file = self.cards_dir / f"{card_num:02d}.md"
-        if card_file.exists():
-            return card_file.read_text()
-        return ""
+        return self.read_card(card_num)[1]
+    
+    def read_card(self, card_num: int) -> Tuple[str, str]:
+        """Get (title, content) for a card with one read, reusing it while the file is unchanged."""
+        path = self.card_path(card_num)
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            self._card_cache.pop(card_num, None)
+            return "", ""
+        
+        cached = self._card_cache.get(card_num)
+        if cached and cached[0] == mtime_ns:
+            return cached[1], cached[2]
+        
+        content = self._read_card_text(path)
+        title = _card_title(content)
+        self._card_cache[card_num] = (mtime_ns, title, content)
+        return title, content
+    
+    @staticmethod
+    def _read_card_text(path) -> str:
+        """Read a card file, treating a missing file as empty."""
+        try:
+            with open(path, "rb") as f:
+                return _decode_card(f.read())
+        except FileNotFoundError:
+            return ""
+    
+    def iter_card_contents(self, card_nums: List[int]) -> Iterator[str]:
+        """Yield the content of each card in order, overlapping the reads a few cards ahead."""
+        entries = self._scan_cards_dir()
+        paths = [entries[n].path if n in entries else None for n in card_nums]
+        if sum(path is not None for path in paths) <= 8:
+            for path in paths:
+                yield self._read_card_text(path) if path else ""
+            return
+        
+        # Only a window of reads is in flight, so an export holds a few cards at a time, not the whole script
+        with ThreadPoolExecutor(max_workers=_IO_WORKERS) as executor:
+            pending = deque()
+            for path in paths:
+                pending.append(executor.submit(self._read_card_text, path) if path else None)
+                if len(pending) > _IO_WORKERS:
+                    future = pending.popleft()
+                    yield future.result() if future else ""
+            for future in pending:
+                yield future.result() if future else ""
     
     def save_card_content(self, card_num: int, content: str):
         """Save content to a specific card."""
-        card_file = self.cards_dir / f"{card_num:02d}.md"
-        card_file.write_text(content)
+        _atomic_write(self.card_path(card_num), content.encode("utf-8"))
+        self._forget_card(card_num)
     
     def is_card_written(self, card_num: int) -> bool:
         """Check if card has substantial content."""
-        content = self.get_card_content(card_num)
-        # Consider written if more than just the header
-        lines = [line.strip() for line in content.split('\n') if line.strip()]
-        return len(lines) > 1 or (len(lines) == 1 and not lines[0].startswith('#'))
+        return self._parse_card(self.card_path(card_num))[1]
     
     def swap_cards(self, pos1: int, pos2: int):
         """Swap two cards in the order."""
@@ -121,108 +408,178 @@ class Project:
     
     def rename_card(self, card_num: int, new_title: str):
         """Rename a card by updating its markdown header."""
-        card_file = self.cards_dir / f"{card_num:02d}.md"
+        card_file = self.card_path(card_num)
+        
+        try:
+            content = _decode_card(card_file.read_bytes())
+        except FileNotFoundError:
+            if new_title.strip():
+                # Create new file with header
+                card_file.write_text(f"# {new_title}\n\n", encoding="utf-8")
+                self._forget_card(card_num)
+            return
+        
+        # Only the first line changes, so slice around it instead of splitting every line
+        first_line, newline, rest = content.partition('\n')
+        has_header = first_line.strip().startswith('#')
         
         if new_title.strip():
-            # Add or update the header
-            if card_file.exists():
-                content = card_file.read_text()
-                lines = content.split('\n')
-                
-                # If first line is a header, replace it; otherwise prepend
-                if lines and lines[0].strip().startswith('#'):
-                    lines[0] = f"# {new_title}"
-                else:
-                    lines.insert(0, f"# {new_title}")
-                    if lines[1:] and lines[1].strip():  # Add blank line if content follows
-                        lines.insert(1, "")
-                
-                card_file.write_text('\n'.join(lines))
+            # If first line is a header, replace it; otherwise prepend
+            header = f"# {new_title}"
+            if has_header:
+                if first_line == header:
+                    return  # Title unchanged, nothing to write
+                new_content = header + newline + rest
             else:
-                # Create new file with header
-                card_file.write_text(f"# {new_title}\n\n")
+                # Add blank line if content follows
+                new_content = header + ("\n\n" if first_line.strip() else "\n") + content
         else:
             # Remove header if title is empty
-            if card_file.exists():
-                content = card_file.read_text()
-                lines = content.split('\n')
-                if lines and lines[0].strip().startswith('#'):
-                    lines = lines[1:]
-                    # Remove blank line after header if it exists
-                    if lines and not lines[0].strip():
-                        lines = lines[1:]
-                    card_file.write_text('\n'.join(lines))
+            if not has_header:
+                return
+            # Remove blank line after header if it exists
+            next_line, _, after = rest.partition('\n')
+            new_content = rest if next_line.strip() else after
+        
+        card_file.write_text(new_content, encoding="utf-8")
+        self._forget_card(card_num)
+    
+    def _walk_cards(self, with_bodies: bool, with_meta: bool) -> Iterator[Tuple[int, int, str, Tuple[str, bool]]]:
+        """Yield (position, card_num, body, (title, is_written)) in card order, loading only what is asked for."""
+        order = self.load_card_order()
+        contents = self.iter_card_contents(order) if with_bodies else repeat("")
+        meta = self.load_card_meta() if with_meta else {}
+        for i, (card_num, content) in enumerate(zip(order, contents), 1):
+            # Remove the title line since exports use their own
+            body = content.partition('\n')[2].strip()
+            yield i, card_num, body, meta.get(card_num, ("", False))
+    
+    # Each export format is a header plus one chunk per card; a card's chunk is
+    # built from (position, card_num, body, (title, is_written)).
+    
+    def _screenplay_md_header(self) -> str:
+        return f"# {self.name}\n\nGenerated: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n\n---\n\n"
+    
+    def _screenplay_md_card(self, i: int, card_num: int, body: str, meta: Tuple[str, bool]) -> str:
+        return f"## Scene {i}\n\n{body}\n\n---\n\n" if body else ""
+    
+    def _fountain_header(self) -> str:
+        return f"Title: {self.name}\nAuthor: \nDraft date: {datetime.now().strftime('%m/%d/%Y')}\n\n"
+    
+    def _fountain_card(self, i: int, card_num: int, body: str, meta: Tuple[str, bool]) -> str:
+        return f"INT./EXT. SCENE {i}\n\n{body}\n\n" if body else ""
+    
+    def _outline_header(self) -> str:
+        return f"# {self.name} - Story Outline\n\n"
+    
+    def _outline_card(self, i: int, card_num: int, body: str, meta: Tuple[str, bool]) -> str:
+        title, written = meta
+        status = "●" if written else "○"
+        if title:
+            return f"{i:02d}. {status} {title}\n"
+        return f"{i:02d}. {status} [Card {card_num}]\n"
+    
+    # format -> (header, card chunk, needs card bodies, needs card meta)
+    _EXPORT_FORMATS = {
+        "md": (_screenplay_md_header, _screenplay_md_card, True, False),
+        "fountain": (_fountain_header, _fountain_card, True, False),
+        "outline": (_outline_header, _outline_card, False, True),
+    }
+    
+    def _iter_export(self, fmt: str) -> Iterator[str]:
+        """Yield one export format a card at a time."""
+        header, card, with_bodies, with_meta = self._EXPORT_FORMATS[fmt]
+        yield header(self)
+        for fields in self._walk_cards(with_bodies, with_meta):
+            yield card(self, *fields)
+    
+    def iter_screenplay_md(self) -> Iterator[str]:
+        """Yield the markdown screenplay one scene at a time."""
+        return self._iter_export("md")
+    
+    def iter_fountain(self) -> Iterator[str]:
+        """Yield the Fountain export one scene at a time."""
+        return self._iter_export("fountain")
+    
+    def iter_outline(self) -> Iterator[str]:
+        """Yield the outline one card at a time."""
+        return self._iter_export("outline")
+    
+    def export_all(self, out_paths: Dict[str, Path]):
+        """Write several export formats, keyed by format name, with a single pass over the cards."""
+        formats = {fmt: self._EXPORT_FORMATS[fmt] for fmt in out_paths}
+        with ExitStack() as stack:
+            files = {
+                fmt: stack.enter_context(open(path, "w", encoding="utf-8", buffering=1 << 16))
+                for fmt, path in out_paths.items()
+            }
+            for fmt, (header, _, _, _) in formats.items():
+                files[fmt].write(header(self))
+            with_bodies = any(spec[2] for spec in formats.values())
+            with_meta = any(spec[3] for spec in formats.values())
+            for fields in self._walk_cards(with_bodies, with_meta):
+                for fmt, (_, card, _, _) in formats.items():
+                    files[fmt].write(card(self, *fields))
     
     def export_screenplay_md(self) -> str:
         """Export all cards as a single markdown screenplay."""
-        order = self.load_card_order()
-        screenplay = f"# {self.name}\n\n"
-        screenplay += f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n\n"
-        screenplay += "---\n\n"
-        
-        for i, card_num in enumerate(order, 1):
-            content = self.get_card_content(card_num)
-            # Remove the title line since we'll use our own
-            lines = content.split('\n')[1:]  # Skip first line (title)
-            card_content = '\n'.join(lines).strip()
-            
-            if card_content:
-                screenplay += f"## Scene {i}\n\n{card_content}\n\n---\n\n"
-        
-        return screenplay
+        return "".join(self.iter_screenplay_md())
     
     def export_fountain(self) -> str:
         """Export as Fountain format."""
-        order = self.load_card_order()
-        fountain = f"Title: {self.name}\n"
-        fountain += f"Author: \n"
-        fountain += f"Draft date: {datetime.now().strftime('%m/%d/%Y')}\n\n"
-        
-        for i, card_num in enumerate(order, 1):
-            content = self.get_card_content(card_num)
-            lines = content.split('\n')[1:]  # Skip title
-            card_content = '\n'.join(lines).strip()
-            
-            if card_content:
-                fountain += f"INT./EXT. SCENE {i}\n\n{card_content}\n\n"
-        
-        return fountain
+        return "".join(self.iter_fountain())
     
     def export_outline(self) -> str:
         """Export as simple outline."""
-        order = self.load_card_order()
-        outline = f"# {self.name} - Story Outline\n\n"
-        
-        for i, card_num in enumerate(order, 1):
-            title = self.get_card_title_from_file(card_num)
-            status = "●" if self.is_card_written(card_num) else "○"
-            
-            if title:
-                outline += f"{i:02d}. {status} {title}\n"
-            else:
-                outline += f"{i:02d}. {status} [Card {card_num}]\n"
-        
-        return outline
+        return "".join(self.iter_outline())
+
+
+# Opened projects by id, so their caches survive trips back to the project list
+_PROJECT_INSTANCES: Dict[str, Project] = {}
 
 
 class ProjectManager:
     """Manages project configuration and selection."""
     
+    # (mtime_ns, config) of the last config read or written
+    _cache: Optional[Tuple[int, dict]] = None
+    # Digest of the bytes currently on disk, to skip no-op saves
+    _disk_digest: Optional[bytes] = None
+    
+    @staticmethod
+    def _digest(data: bytes) -> bytes:
+        """Short content hash of serialized config."""
+        return hashlib.blake2b(data, digest_size=8).digest()
+    
     @staticmethod
     def load_config() -> dict:
         """Load projects configuration."""
-        if CONFIG_FILE.exists():
-            try:
-                return json.loads(CONFIG_FILE.read_text())
-            except (json.JSONDecodeError, FileNotFoundError):
-                pass
+        try:
+            mtime_ns = CONFIG_FILE.stat().st_mtime_ns
+            cache = ProjectManager._cache
+            if cache and cache[0] == mtime_ns:
+                return cache[1]
+            data = CONFIG_FILE.read_bytes()
+            ProjectManager._disk_digest = ProjectManager._digest(data)
+            config = json.loads(data)
+            ProjectManager._cache = (mtime_ns, config)
+            return config
+        except (json.JSONDecodeError, FileNotFoundError):
+            ProjectManager._disk_digest = None
         return {"projects": {}, "last_project": None}
     
     @staticmethod
     def save_config(config: dict):
         """Save projects configuration."""
+        data = json.dumps(config, indent=2).encode()
+        digest = ProjectManager._digest(data)
+        if digest == ProjectManager._disk_digest and CONFIG_FILE.exists():
+            return  # Nothing changed
+        
         CONFIG_DIR.mkdir(exist_ok=True)
-        CONFIG_FILE.write_text(json.dumps(config, indent=2))
+        _atomic_write(CONFIG_FILE, data)
+        ProjectManager._disk_digest = digest
+        ProjectManager._cache = (CONFIG_FILE.stat().st_mtime_ns, config)
     
     @staticmethod
     def add_project(name: str, path: str) -> str:
@@ -260,14 +617,18 @@ class ProjectManager:
     @staticmethod
     def delete_project_permanently(project_id: str):
         """Remove project from config AND delete all files."""
+        import shutil
+        
         config = ProjectManager.load_config()
         
         if project_id in config["projects"]:
             project_path = Path(config["projects"][project_id]["path"])
             
-            # Delete the project directory if it exists
-            if project_path.exists():
+            # Delete the project directory; it may already be gone
+            try:
                 shutil.rmtree(project_path)
+            except FileNotFoundError:
+                pass
             
             # Remove from config
             ProjectManager.remove_project(project_id)
@@ -376,6 +737,8 @@ class ProjectLoadingScreen(Screen):
         self.project = project
         self.current_progress = 0
         self.total_cards = 70
+        self._posted_card = 0
+        self._posted_at = 0.0
     
     def compose(self) -> ComposeResult:
         yield Header()
@@ -390,36 +753,46 @@ class ProjectLoadingScreen(Screen):
     
     def on_mount(self):
         """Start loading the project."""
+        self._progress_bar = self.query_one("#progress_bar", ProgressBar)
+        self._status = self.query_one("#loading_status", Static)
+        self._progress_text = self.query_one("#progress_text", Static)
         self.load_project_async()
     
     def update_progress(self, current: int, total: int):
         """Update the progress display."""
         self.current_progress = current
-        
-        # Update progress bar
-        progress_bar = self.query_one("#progress_bar", ProgressBar)
-        progress_bar.update(progress=current)
-        
-        # Update status text
-        status = self.query_one("#loading_status", Static)
-        status.update(f"Loading cards... {current}/{total}")
-        
-        # Update progress percentage
-        progress_text = self.query_one("#progress_text", Static)
         percentage = (current / total) * 100
-        progress_text.update(f"{percentage:.0f}% complete")
-    
+        
+        # Repaint all three widgets in one pass
+        with self.app.batch_update():
+            self._progress_bar.update(progress=current)
+            self._status.update(f"Loading cards... {current}/{total}")
+            self._progress_text.update(f"{percentage:.0f}% complete")
+    
+    def _post_progress(self, current: int, total: int):
+        """Hand progress to the UI thread, at most every 5 cards or 50 ms."""
+        now = time.monotonic()
+        if current == total or current - self._posted_card >= 5 or now - self._posted_at >= 0.05:
+            self._posted_card = current
+            self._posted_at = now
+            self.app.call_from_thread(self.update_progress, current, total)
+    
+    @work(thread=True, exclusive=True)
     def load_project_async(self):
         """Load project data with progress updates."""
         try:
             # Load card titles with progress callback
-            self.project.load_card_titles(progress_callback=lambda current, total: self.update_progress(current, total))
+            self.project.load_card_titles(progress_callback=self._post_progress)
             
             # Loading complete
-            self.loading_complete()
+            self.app.call_from_thread(self.loading_complete)
         except Exception as e:
-            self.notify(f"Error loading project: {e}", severity="error")
-            self.app.pop_screen()
+            self.app.call_from_thread(self.loading_failed, e)
+    
+    def loading_failed(self, error: Exception):
+        """Called when loading raised an error."""
+        self.notify(f"Error loading project: {error}", severity="error")
+        self.app.pop_screen()
     
     def loading_complete(self):
         """Called when loading is finished."""
@@ -472,6 +845,7 @@ Commands to use in main editor:
 - **Markdown**: Clean screenplay format
 - **Fountain**: Industry standard format
 - **Outline**: Story structure overview
+- **All**: Writes all three at once
 
 ---
 💡 **Tip**: All shortcuts use Ctrl+key to avoid conflicts with normal typing.
@@ -506,6 +880,17 @@ class ProjectSelectionScreen(Screen):
         """Setup project list when screen loads."""
         self.refresh_project_list()
     
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def format_last_opened(last_opened: str) -> str:
+        """Format a stored ISO timestamp for display, memoized per value."""
+        if last_opened == "Never":
+            return last_opened
+        try:
+            return datetime.fromisoformat(last_opened).strftime("%Y-%m-%d %H:%M")
+        except (TypeError, ValueError):
+            return "Unknown"
+    
     def refresh_project_list(self):
         """Refresh the project list."""
         project_list = self.query_one("#project_list", ListView)
@@ -518,13 +903,7 @@ class ProjectSelectionScreen(Screen):
         else:
             for project_id, project_data in projects.items():
                 name = project_data["name"]
-                last_opened = project_data.get("last_opened", "Never")
-                if last_opened != "Never":
-                    try:
-                        dt = datetime.fromisoformat(last_opened)
-                        last_opened = dt.strftime("%Y-%m-%d %H:%M")
-                    except:
-                        last_opened = "Unknown"
+                last_opened = self.format_last_opened(project_data.get("last_opened", "Never"))
                 
                 item_text = f"{name}\n  Last opened: {last_opened}"
                 list_item = ListItem(Static(item_text))
@@ -573,9 +952,16 @@ class ProjectSelectionScreen(Screen):
             # Update last opened
             ProjectManager.update_last_opened(event.item.project_id)
             
-            # Create project instance and show loading screen
-            project = Project(project_data["name"], project_data["path"])
-            self.app.push_screen(ProjectLoadingScreen(project))
+            # Reuse the project instance if it was opened before
+            project = _PROJECT_INSTANCES.get(event.item.project_id)
+            if project is None or project.path != Path(project_data["path"]):
+                project = Project(project_data["name"], project_data["path"])
+                _PROJECT_INSTANCES[event.item.project_id] = project
+            
+            if project.titles_loaded:
+                self.app.push_screen(EditorScreen(project))
+            else:
+                self.app.push_screen(ProjectLoadingScreen(project))
 
 
 class DeleteProjectScreen(Screen):
@@ -611,6 +997,7 @@ class DeleteProjectScreen(Screen):
         """Remove project from list but keep files."""
         try:
             ProjectManager.remove_project(self.project_id)
+            _PROJECT_INSTANCES.pop(self.project_id, None)
             self.notify("Project removed from list (files kept)", severity="information")
             self.dismiss(True)
         except Exception as e:
@@ -629,6 +1016,7 @@ class DeleteProjectScreen(Screen):
         if confirmed:
             try:
                 ProjectManager.delete_project_permanently(self.project_id)
+                _PROJECT_INSTANCES.pop(self.project_id, None)
                 self.notify("Project deleted permanently", severity="information")
                 self.dismiss(True)
             except Exception as e:
@@ -802,10 +1190,19 @@ class EditorScreen(Screen):
         Binding("?", "show_help", "Help"),
     ]
     
+    _COMMAND_RE = re.compile(r'\s*(?P<cmd>swap|rename|open)\s+(?P<args>.*\S)', re.IGNORECASE)
+    # rename arguments: card number, then the title as typed, minus one pair of optional quotes
+    _RENAME_ARGS_RE = re.compile(r'(\S+)\s+["\']?(.*?)["\']?\s*$')
+    
     def __init__(self, project: Project):
         super().__init__()
         self.project = project
         self.current_card = 1
+        # Cards whose list entries need redrawing on the next refresh
+        self._dirty_cards = set()
+        self._refresh_pending = False
+        # An editor push is queued but hasn't run yet
+        self._editor_pending = False
     
     def compose(self) -> ComposeResult:
         yield Header()
@@ -829,28 +1226,51 @@ class EditorScreen(Screen):
         self.refresh_card_list()
         self.update_preview()
     
+    @staticmethod
+    def card_item_text(card_num: int, title: str, written: bool) -> str:
+        """Format a card list entry."""
+        status = "●" if written else "○"
+        
+        # Clean display - show title only if it exists and isn't just a number
+        if title and title.strip():
+            return f"[{card_num:02d}] {status} {title}"
+        return f"[{card_num:02d}] {status}"
+    
     def refresh_card_list(self):
-        """Refresh the card list display."""
+        """Rebuild the card list display."""
         card_list = self.query_one("#card_list", ListView)
         card_list.clear()
         
         order = self.project.load_card_order()
-        titles = self.project.load_card_titles()  # Now reads from markdown files
+        meta = self.project.load_card_meta()  # Cached per card, re-read only on change
         
+        self._card_items = []
         for i, card_num in enumerate(order):
-            title = titles.get(str(card_num), "")
-            status = "●" if self.project.is_card_written(card_num) else "○"
-            
-            # Clean display - show title only if it exists and isn't just a number
-            if title and title.strip():
-                item_text = f"[{card_num:02d}] {status} {title}"
-            else:
-                item_text = f"[{card_num:02d}] {status}"
-            
-            list_item = ListItem(Static(item_text))
+            title, written = meta.get(card_num, ("", False))
+            list_item = ListItem(Static(self.card_item_text(card_num, title, written)))
             list_item.card_num = card_num
             list_item.position = i
-            card_list.append(list_item)
+            self._card_items.append(list_item)
+        card_list.extend(self._card_items)
+    
+    def _render_card_item(self, list_item: ListItem):
+        """Redraw one list entry from its card's current meta."""
+        title, written = self.project.get_card_meta(list_item.card_num)
+        list_item.query_one(Static).update(self.card_item_text(list_item.card_num, title, written))
+    
+    def update_card_item(self, card_num: int):
+        """Redraw the list entry for a single card."""
+        for list_item in self._card_items:
+            if list_item.card_num == card_num:
+                self._render_card_item(list_item)
+                break
+    
+    def swap_card_items(self, pos1: int, pos2: int):
+        """Swap two list entries in place after the project order changed."""
+        item1, item2 = self._card_items[pos1], self._card_items[pos2]
+        item1.card_num, item2.card_num = item2.card_num, item1.card_num
+        self._render_card_item(item1)
+        self._render_card_item(item2)
     
     def update_preview(self):
         """Update the card preview panel."""
@@ -882,53 +1302,99 @@ class EditorScreen(Screen):
     
     def execute_command(self, command: str):
         """Execute user commands."""
-        parts = command.split()
-        if not parts:
-            return
-        
-        cmd = parts[0].lower()
-        
-        if cmd == "swap" and len(parts) == 3:
-            try:
-                pos1, pos2 = int(parts[1]) - 1, int(parts[2]) - 1
-                if self.project.swap_cards(pos1, pos2):
-                    self.refresh_card_list()
-                    self.notify(f"Swapped positions {parts[1]} and {parts[2]}")
-                else:
-                    self.notify("Invalid positions", severity="error")
-            except ValueError:
-                self.notify("Invalid command format", severity="error")
-        
-        elif cmd == "rename" and len(parts) >= 3:
-            try:
-                card_num = int(parts[1])
-                new_title = ' '.join(parts[2:]).strip('"\'')
-                self.project.rename_card(card_num, new_title)
-                self.refresh_card_list()
-                self.notify(f"Renamed card {card_num}")
-            except ValueError:
-                self.notify("Invalid command format", severity="error")
-        
-        elif cmd == "open" and len(parts) == 2:
-            try:
-                card_num = int(parts[1])
-                self.edit_card(card_num)
-            except ValueError:
-                self.notify("Invalid card number", severity="error")
-        
-        else:
+        match = self._COMMAND_RE.match(command)
+        if not match or not self._COMMANDS[match["cmd"].lower()](self, match["args"]):
             self.notify("Unknown command. Try: swap 3 5, rename 2 'title', open 5", severity="error")
     
+    # Command handlers take the text after the command word and return
+    # False when the argument count is wrong.
+    
+    def _command_swap(self, args: str) -> bool:
+        """swap A B"""
+        positions = args.split()
+        if len(positions) != 2:
+            return False
+        try:
+            pos1, pos2 = int(positions[0]) - 1, int(positions[1]) - 1
+            if pos1 < 0 or pos2 < 0:
+                # Out of range without loading the card order
+                self.notify("Invalid positions", severity="error")
+            elif pos1 == pos2:
+                # Nothing to write or redraw
+                self.notify("No-op swap")
+            elif self.project.swap_cards(pos1, pos2):
+                # Redraw after the input handler returns
+                self.call_later(self.swap_card_items, pos1, pos2)
+                self.notify(f"Swapped positions {positions[0]} and {positions[1]}")
+            else:
+                self.notify("Invalid positions", severity="error")
+        except ValueError:
+            self.notify("Invalid command format", severity="error")
+        return True
+    
+    def _command_rename(self, args: str) -> bool:
+        """rename N 'title'"""
+        match = self._RENAME_ARGS_RE.match(args)
+        if not match:
+            return False
+        try:
+            card_num = int(match[1])
+            new_title = match[2]
+            self.project.rename_card(card_num, new_title)
+            self._schedule_refresh(card_num)
+            self.notify(f"Renamed card {card_num}")
+        except ValueError:
+            self.notify("Invalid command format", severity="error")
+        return True
+    
+    def _command_open(self, args: str) -> bool:
+        """open N"""
+        if len(args.split()) != 1:
+            return False
+        try:
+            card_num = int(args)
+            self.edit_card(card_num)
+        except ValueError:
+            self.notify("Invalid card number", severity="error")
+        return True
+    
+    _COMMANDS = {"swap": _command_swap, "rename": _command_rename, "open": _command_open}
+    
     def edit_card(self, card_num: int):
         """Edit a card using built-in text editor."""
+        if self._editor_pending:
+            return  # A repeated key or command already queued an editor
+        self._editor_pending = True
+        # Mount the editor after the current handler returns, so commands and key presses finish first
+        self.call_later(self._open_editor, card_num)
+    
+    def _open_editor(self, card_num: int):
+        """Push the text editor for a card."""
+        self._editor_pending = False
+        if not self.is_active:
+            return
         self.app.push_screen(TextEditorScreen(self.project, card_num), self.on_card_edited)
     
     def on_card_edited(self, result=None):
         """Handle return from card editor."""
-        # Refresh display after editing
-        self.refresh_card_list()
-        if hasattr(self, 'current_card'):
-            self.update_preview()
+        # Refresh the edited card's entry
+        self._schedule_refresh(result)
+    
+    def _schedule_refresh(self, card_num: Optional[int] = None):
+        """Queue a redraw of a card's entry and the preview, batched into the next frame."""
+        if card_num is not None:
+            self._dirty_cards.add(card_num)
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.call_after_refresh(self._do_refresh)
+    
+    def _do_refresh(self):
+        """Redraw every entry queued since the last frame, then the preview."""
+        self._refresh_pending = False
+        for card_num in self._dirty_cards:
+            self.update_card_item(card_num)
+        self._dirty_cards.clear()
+        self.update_preview()
     
     def action_edit_card(self):
         """Edit current selected card."""
@@ -971,15 +1437,21 @@ class TextEditorScreen(Screen):
         super().__init__()
         self.project = project
         self.card_num = card_num
-        self.original_content = project.get_card_content(card_num)
+        self.card_title, self.original_content = project.read_card(card_num)
         self.has_changes = False
+        self._dirty_timer: Optional[Timer] = None
+        self._os_paste_cache: Optional[Tuple[float, str]] = None
+        # True while a save is being written
+        self._saving = False
+        # Save requested while another save was being written
+        self._save_pending = False
+        # Close requested while saving or while another screen was on top
+        self._close_pending = False
     
     def compose(self) -> ComposeResult:
-        card_title = self.project.get_card_title_from_file(self.card_num)
-        
         # Show card number if no title, or title if it exists
-        if card_title:
-            header_title = f"# Editing: [{self.card_num:02d}] {card_title}"
+        if self.card_title:
+            header_title = f"# Editing: [{self.card_num:02d}] {self.card_title}"
         else:
             header_title = f"# Editing: Card [{self.card_num:02d}]"
         
@@ -994,8 +1466,8 @@ class TextEditorScreen(Screen):
     
     def on_mount(self):
         """Focus the text editor."""
-        text_area = self.query_one("#text_editor", TextArea)
-        text_area.focus()
+        self._text_area = self.query_one("#text_editor", TextArea)
+        self._text_area.focus()
     
     def action_show_help(self):
         """Show help screen."""
@@ -1003,15 +1475,67 @@ class TextEditorScreen(Screen):
     
     def on_text_area_changed(self, event):
         """Track changes to the text."""
+        # Set immediately so closing right after typing still prompts to save
         self.has_changes = True
+        if self._dirty_timer:
+            self._dirty_timer.stop()
+        self._dirty_timer = self.set_timer(0.3, self._on_idle_change)
+    
+    def _on_idle_change(self):
+        """Update state derived from the text once typing pauses."""
+        self._dirty_timer = None
+        # Edits that were undone back to the saved text leave nothing to save
+        text_area = self._text_area
+        self.has_changes = text_area.text != self.original_content
+    
+    def action_save(self, close: bool = False):
+        """Save the current content, optionally closing the editor once it is written."""
+        if close:
+            self._close_pending = True
+        if self._saving:
+            # Runs once the current save lands, which then closes the editor if asked to
+            self._save_pending = True
+            return
+        content = self._text_area.text
+        if content == self.original_content:
+            # Nothing new to write
+            self.save_finished(content)
+        else:
+            self._saving = True
+            self.save_content(content)
     
-    def action_save(self):
-        """Save the current content."""
-        text_area = self.query_one("#text_editor", TextArea)
-        content = text_area.text
-        self.project.save_card_content(self.card_num, content)
-        self.has_changes = False
+    @work(thread=True, exclusive=True)
+    def save_content(self, content: str):
+        """Write the card off the UI thread."""
+        try:
+            self.project.save_card_content(self.card_num, content)
+            self.app.call_from_thread(self.save_finished, content)
+        except Exception as e:
+            self.app.call_from_thread(self.save_failed, e)
+    
+    def save_finished(self, content: str):
+        """Record a finished save."""
+        self._saving = False
+        self.original_content = content
+        self.has_changes = self._text_area.text != content
         self.notify(f"Saved card {self.card_num}")
+        if self._save_pending:
+            self._save_pending = False
+            if self.has_changes:
+                # Text typed during the save still needs writing; any pending close waits for it
+                self.action_save()
+                return
+        if self._close_pending:
+            self._close_pending = False
+            # Prompts again if the text changed while the save was running
+            self.action_close_with_save_check()
+    
+    def save_failed(self, error: Exception):
+        """Report a failed save and keep the editor open."""
+        self._saving = False
+        self._save_pending = False
+        self._close_pending = False
+        self.notify(f"Save failed: {error}", severity="error")
     
     def action_quit_app(self):
         """Quit the entire application."""
@@ -1019,32 +1543,43 @@ class TextEditorScreen(Screen):
     
     def action_close_with_save_check(self):
         """Close editor with save check dialog."""
-        if self.has_changes:
+        if self._saving or not self.is_active:
+            # Close once the save lands or this screen is back on top
+            # (is_current would also be true under a screen that doesn't cover it)
+            self._close_pending = True
+        elif self.has_changes:
             # Show save dialog with three options
-            def handle_save_choice(choice):
-                if choice == "save":
-                    self.action_save()
-                    self.app.pop_screen()
-                elif choice == "dont_save":
-                    self.app.pop_screen()
-                # else: cancel - do nothing
-            
-            self.app.push_screen(SaveConfirmDialog(handle_save_choice))
+            self.app.push_screen(SaveConfirmDialog(self._on_save_choice))
         else:
             # No changes, just close
-            self.app.pop_screen()
+            self.dismiss(self.card_num)
+    
+    def on_screen_resume(self):
+        """Finish a close that was requested while another screen was on top."""
+        if self._close_pending and not self._saving:
+            self._close_pending = False
+            self.action_close_with_save_check()
+    
+    def _on_save_choice(self, choice):
+        """Act on the save dialog's answer."""
+        if choice == "save":
+            # Closes once the card is on disk, so the card list sees the new content
+            self.action_save(close=True)
+        elif choice == "dont_save":
+            self.dismiss(self.card_num)
+        # else: cancel - do nothing
     
     def action_save_and_close(self):
         """Save and close the editor."""
-        self.action_save()
-        self.app.pop_screen()
+        self.action_save(close=True)
     
     def action_copy_selected(self):
         """Copy selected text to clipboard."""
-        text_area = self.query_one("#text_editor", TextArea)
+        text_area = self._text_area
         try:
             if hasattr(text_area, 'selected_text') and text_area.selected_text:
-                self.copy_to_system_clipboard(text_area.selected_text)
+                self.app.clipboard_ring.push(text_area.selected_text)
+                self.app.queue_clipboard_sync(self.copy_to_system_clipboard)
                 self.notify("Copied selected text")
             else:
                 self.notify("No text selected")
@@ -1053,10 +1588,28 @@ class TextEditorScreen(Screen):
     
     def action_paste(self):
         """Paste from clipboard."""
+        # Text copied in this app is served from memory
+        clipboard_content = self.app.clipboard_ring.top()
+        if clipboard_content is None:
+            # The OS clipboard needs a helper process; fetch it without holding up key handling
+            self.run_worker(self._paste_from_system(), group="clipboard")
+        else:
+            self._insert_paste(clipboard_content)
+    
+    async def _paste_from_system(self):
+        """Fetch the OS clipboard and paste it."""
+        try:
+            clipboard_content = await self.get_from_system_clipboard()
+        except Exception as e:
+            self.notify(f"Paste failed: {e}", severity="error")
+            return
+        self._insert_paste(clipboard_content)
+    
+    def _insert_paste(self, clipboard_content: str):
+        """Insert pasted text at the cursor."""
         try:
-            clipboard_content = self.get_from_system_clipboard()
             if clipboard_content:
-                text_area = self.query_one("#text_editor", TextArea)
+                text_area = self._text_area
                 text_area.insert(clipboard_content)
                 self.notify("Pasted from clipboard")
             else:
@@ -1066,11 +1619,12 @@ class TextEditorScreen(Screen):
     
     def action_cut(self):
         """Cut selected text."""
-        text_area = self.query_one("#text_editor", TextArea)
+        text_area = self._text_area
         try:
             if hasattr(text_area, 'selected_text') and text_area.selected_text:
-                self.copy_to_system_clipboard(text_area.selected_text)
-                text_area.delete_selection()
+                self.app.clipboard_ring.push(text_area.selected_text)
+                self.app.queue_clipboard_sync(self.copy_to_system_clipboard)
+                text_area.delete(*text_area.selection)
                 self.notify("Cut selected text")
             else:
                 self.notify("No text selected")
@@ -1079,37 +1633,28 @@ class TextEditorScreen(Screen):
     
     def action_select_all(self):
         """Select all text."""
-        text_area = self.query_one("#text_editor", TextArea)
+        text_area = self._text_area
         text_area.select_all()
     
     def action_undo(self):
         """Undo last action."""
-        text_area = self.query_one("#text_editor", TextArea)
+        text_area = self._text_area
         text_area.undo()
     
-    def copy_to_system_clipboard(self, text: str):
+    async def copy_to_system_clipboard(self, text: str):
         """Copy text to system clipboard."""
-        system = platform.system()
-        if system == "Darwin":  # macOS
-            subprocess.run(["pbcopy"], input=text, text=True, check=True)
-        elif system == "Linux":
-            subprocess.run(["xclip", "-selection", "clipboard"], input=text, text=True, check=True)
-        elif system == "Windows":
-            subprocess.run(["clip"], input=text, text=True, check=True)
-    
-    def get_from_system_clipboard(self) -> str:
+        await _CLIP_BACKEND[0](text)
+    
+    async def get_from_system_clipboard(self) -> str:
         """Get text from system clipboard."""
-        system = platform.system()
-        if system == "Darwin":  # macOS
-            result = subprocess.run(["pbpaste"], capture_output=True, text=True, check=True)
-            return result.stdout
-        elif system == "Linux":
-            result = subprocess.run(["xclip", "-selection", "clipboard", "-o"], capture_output=True, text=True, check=True)
-            return result.stdout
-        elif system == "Windows":
-            result = subprocess.run(["powershell", "-command", "Get-Clipboard"], capture_output=True, text=True, check=True)
-            return result.stdout
-        return ""
+        # Repeated pastes in quick succession reuse the last fetch
+        now = time.monotonic()
+        if self._os_paste_cache and now - self._os_paste_cache[0] < 0.5:
+            return self._os_paste_cache[1]
+        
+        content = await _CLIP_BACKEND[1]()
+        self._os_paste_cache = (now, content)
+        return content
 
 
 class TextDisplayScreen(Screen):
@@ -1120,16 +1665,59 @@ class TextDisplayScreen(Screen):
         Binding("q", "close", "Close"),
     ]
     
+    # Lines written per frame, so a long script appears without stalling the UI
+    FEED_CHUNK = 500
+    
     def __init__(self, title: str, content: str):
         super().__init__()
         self.title = title
         self.content = content
+        self._lines: List[str] = []
+        self._fed = 0
+        # Content width the log's lines were wrapped at
+        self._wrap_width: Optional[int] = None
     
     def compose(self) -> ComposeResult:
         yield Header()
-        yield Static(f"# {self.title}\n\n{self.content}", id="content")
+        yield Static(f"# {self.title}", id="content_title")
+        # RichLog only renders the lines in view, unlike one Static holding the whole text
+        yield RichLog(id="content", markup=False, wrap=True, auto_scroll=False)
         yield Footer()
     
+    def on_mount(self):
+        """Start feeding the text into the log."""
+        self._log = self.query_one("#content", RichLog)
+        self._lines = self.content.split("\n")
+        self.call_after_refresh(self._feed_chunks)
+    
+    def on_resize(self):
+        """Rewrap the text once the log has its new size."""
+        self.call_after_refresh(self._rewrap)
+    
+    def _rewrap(self):
+        """Write the text again if the log's width changed since it was wrapped."""
+        if self._log.scrollable_content_region.width == self._wrap_width:
+            return
+        finished = self._fed >= len(self._lines)
+        self._log.clear()
+        self._fed = 0
+        if finished:
+            self.call_after_refresh(self._feed_chunks)
+        # else: the running feed carries on from the top
+    
+    def _feed_chunks(self):
+        """Write the next chunk of lines, rescheduling until all are shown."""
+        if not self._fed:
+            self._wrap_width = self._log.scrollable_content_region.width
+        end = self._fed + self.FEED_CHUNK
+        # An explicit width wraps at the log's own width, not RichLog's 78-column minimum
+        width = self._wrap_width or None
+        for line in self._lines[self._fed:end]:
+            self._log.write(line, width=width)
+        self._fed = end
+        if end < len(self._lines):
+            self.call_after_refresh(self._feed_chunks)
+    
     def action_close(self):
         """Close this screen."""
         self.app.pop_screen()
@@ -1143,11 +1731,20 @@ class ExportScreen(Screen):
         Binding("1", "export_md", "Markdown"),
         Binding("2", "export_fountain", "Fountain"),
         Binding("3", "export_outline", "Outline"),
+        Binding("4", "export_all", "Export all"),
     ]
     
     def __init__(self, project: Project):
         super().__init__()
         self.project = project
+        # Export filenames start with the project name, spaces dashed
+        slug = project.name.replace(' ', '-')
+        self._filenames = {
+            "md": f"{slug}-screenplay.md",
+            "fountain": f"{slug}.fountain",
+            "outline": f"{slug}-outline.txt",
+        }
+        self._exports_dir = project.exports_dir
     
     def compose(self) -> ComposeResult:
         yield Header()
@@ -1155,41 +1752,88 @@ class ExportScreen(Screen):
         yield Static("[1] Screenplay Markdown (.md)")
         yield Static("[2] Fountain Format (.fountain)")
         yield Static("[3] Story Outline (.txt)")
+        yield Static("[4] All of the above")
         yield Footer()
     
     def action_export_md(self):
         """Export as markdown."""
-        content = self.project.export_screenplay_md()
-        filename = f"{self.project.name.replace(' ', '-')}-screenplay.md"
-        self.save_export(filename, content, "Markdown screenplay")
+        filename = self._filenames["md"]
+        self.save_export(filename, self.project.iter_screenplay_md, "Markdown screenplay")
     
     def action_export_fountain(self):
         """Export as fountain."""
-        content = self.project.export_fountain()
-        filename = f"{self.project.name.replace(' ', '-')}.fountain"
-        self.save_export(filename, content, "Fountain format")
+        filename = self._filenames["fountain"]
+        self.save_export(filename, self.project.iter_fountain, "Fountain format")
     
     def action_export_outline(self):
         """Export as outline."""
-        content = self.project.export_outline()
-        filename = f"{self.project.name.replace(' ', '-')}-outline.txt"
-        self.save_export(filename, content, "Story outline")
+        filename = self._filenames["outline"]
+        self.save_export(filename, self.project.iter_outline, "Story outline")
+    
+    def action_export_all(self):
+        """Export every format in one pass over the cards."""
+        self.save_all_exports()
     
-    def save_export(self, filename: str, content: str, format_name: str):
-        """Save export to file."""
+    @work(thread=True, exclusive=True)
+    def save_all_exports(self):
+        """Write all export formats off the UI thread."""
         try:
-            export_file = self.project.exports_dir / filename
-            export_file.write_text(content)
-            self.notify(f"Exported {format_name} to: {export_file}")
-            self.action_close()
+            self.project.export_all({fmt: self._exports_dir / name for fmt, name in self._filenames.items()})
+            self.app.call_from_thread(self.export_finished, f"Exported all formats to: {self._exports_dir}")
         except Exception as e:
-            self.notify(f"Export failed: {e}", severity="error")
+            self.app.call_from_thread(self.notify, f"Export failed: {e}", severity="error")
+    
+    @work(thread=True, exclusive=True)
+    def save_export(self, filename: str, chunks: Callable[[], Iterable[str]], format_name: str):
+        """Stream an export to file off the UI thread."""
+        try:
+            export_file = self._exports_dir / filename
+            with open(export_file, "w", encoding="utf-8", buffering=1 << 16) as f:
+                f.writelines(chunks())
+            self.app.call_from_thread(self.export_finished, f"Exported {format_name} to: {export_file}")
+        except Exception as e:
+            self.app.call_from_thread(self.notify, f"Export failed: {e}", severity="error")
+    
+    def export_finished(self, message: str):
+        """Report a finished export and leave the menu."""
+        self.notify(message)
+        if self.is_current:
+            self.action_close()
     
     def action_close(self):
         """Close export screen."""
         self.app.pop_screen()
 
 
+class _ClipboardRing:
+    """Recent copies made inside the app, newest last."""
+    
+    def __init__(self, maxlen: int = 16):
+        self.entries: Deque[str] = deque(maxlen=maxlen)
+        # False once the OS clipboard may hold something newer than our last copy
+        self.current = False
+        # True while the newest entry has not been copied to the OS clipboard yet
+        self.unsynced = False
+    
+    def push(self, text: str):
+        """Record a copy."""
+        self.entries.append(text)
+        self.current = True
+        self.unsynced = True
+    
+    def top(self) -> Optional[str]:
+        """Newest copy, or None if the OS clipboard should be asked instead."""
+        if self.current and self.entries:
+            return self.entries[-1]
+        return None
+    
+    def synced(self, text: str):
+        """The OS clipboard now holds text; hand pastes back to it unless a newer copy is pending."""
+        # Not every terminal reports focus changes, so this can't wait for AppFocus
+        if not self.unsynced and self.entries and self.entries[-1] == text:
+            self.current = False
+
+
 class scriptedt(App):
     """Main application."""
     
@@ -1224,9 +1868,14 @@ class scriptedt(App):
         margin: 2;
     }
     
+    #content_title {
+        margin: 1 1 0 1;
+    }
+    
     #content {
         margin: 1;
         overflow: auto;
+        scrollbar-gutter: stable;
     }
     
     #editor_title {
@@ -1284,9 +1933,62 @@ class scriptedt(App):
     }
     """
     
+    def __init__(self):
+        super().__init__()
+        self.clipboard_ring = _ClipboardRing()
+        self._clipboard_copy: Optional[Callable[[str], Awaitable[None]]] = None
+        self._clipboard_timer: Optional[Timer] = None
+    
     def on_mount(self):
         """Initialize the app."""
         self.push_screen(ProjectSelectionScreen())
+    
+    def queue_clipboard_sync(self, copy: Callable[[str], Awaitable[None]]):
+        """Copy the newest ring entry to the OS clipboard once copying pauses."""
+        self._clipboard_copy = copy
+        if self._clipboard_timer:
+            self._clipboard_timer.stop()
+        self._clipboard_timer = self.set_timer(0.5, self.sync_os_clipboard)
+    
+    def _take_unsynced_copy(self) -> Optional[str]:
+        """Newest in-app copy if it still needs to reach the OS clipboard."""
+        if self._clipboard_timer:
+            self._clipboard_timer.stop()
+            self._clipboard_timer = None
+        ring = self.clipboard_ring
+        if ring.unsynced and ring.entries and self._clipboard_copy:
+            ring.unsynced = False
+            return ring.entries[-1]
+        return None
+    
+    async def _copy_to_os(self, text: str):
+        """Copy text to the OS clipboard, reporting failures."""
+        try:
+            await self._clipboard_copy(text)
+        except Exception as e:
+            self.notify(f"Copy to system clipboard failed: {e}", severity="error")
+        else:
+            self.clipboard_ring.synced(text)
+    
+    def sync_os_clipboard(self):
+        """Push a pending in-app copy to the OS clipboard in the background."""
+        text = self._take_unsynced_copy()
+        if text is not None:
+            self.run_worker(self._copy_to_os(text), group="clipboard", exclusive=True)
+    
+    def on_app_blur(self):
+        """Make in-app copies available to other applications."""
+        self.sync_os_clipboard()
+    
+    def on_app_focus(self):
+        """The user may have copied something elsewhere; paste from the OS next."""
+        self.clipboard_ring.current = False
+    
+    async def on_unmount(self):
+        """Flush a pending copy before exiting."""
+        text = self._take_unsynced_copy()
+        if text is not None:
+            await self._copy_to_os(text)
 
 
 if __name__ == "__main__":